@@ -4,12 +4,22 @@ import platformdirs
 import yaml
 from objectify import dict_to_object
 
+from .domain import QUALITIES, SOURCE_TYPES
+
+
+class StreamPolicy:
+    sources: list[str]
+    quality: str
+    max_lecture_size: int | None
+
 
 class EchoDownloaderConfig:
     max_logs: int
     path_completion: bool
     delete_source_files: bool
     title_suffixes: dict[str, str]
+    stream_policy: StreamPolicy
+    course_stream_policies: dict[str, StreamPolicy]
 
 
 def load_config() -> EchoDownloaderConfig:
@@ -28,6 +38,40 @@ def load_config() -> EchoDownloaderConfig:
             f.write(file_contents)
     else:
         with open(custom_config_path, 'r') as f:
-            config_dict.update(yaml.safe_load(f))
+            custom_config_dict = yaml.safe_load(f) or {}
+
+        # The custom stream policy only lists the options that differ from the default one
+        stream_policy = config_dict['stream_policy'] | (custom_config_dict.pop('stream_policy', None) or {})
+        config_dict.update(custom_config_dict)
+        config_dict['stream_policy'] = stream_policy
+
+    # Course policies only list the options that differ from the global stream policy
+    config_dict['course_stream_policies'] = {
+        course_uuid: config_dict['stream_policy'] | (policy or {})
+        for course_uuid, policy in (config_dict['course_stream_policies'] or {}).items()
+    }
+
+    validate_stream_policy(config_dict['stream_policy'], 'stream_policy')
+    for course_uuid, policy in config_dict['course_stream_policies'].items():
+        validate_stream_policy(policy, f'course_stream_policies.{course_uuid}')
 
     return dict_to_object(config_dict, EchoDownloaderConfig)
+
+
+def validate_stream_policy(policy: dict, name: str) -> None:
+    sources = policy.get('sources')
+    if not isinstance(sources, list) or not all(isinstance(source, str) for source in sources):
+        raise ValueError(f'Sources in {name} must be a list of source types, got: {sources!r}')
+    if len(set(sources)) != len(sources):
+        raise ValueError(f'Duplicate source type in {name}: {", ".join(sources)}')
+    if unknown := set(sources) - SOURCE_TYPES.keys():
+        raise ValueError(f'Unknown source type in {name}: {", ".join(sorted(unknown))}')
+
+    quality = policy.get('quality')
+    if quality not in QUALITIES:
+        raise ValueError(f'Unknown quality in {name}: {quality} (expected one of {", ".join(QUALITIES)})')
+
+    max_lecture_size = policy.get('max_lecture_size')
+    if max_lecture_size is not None and (type(max_lecture_size) is not int or max_lecture_size <= 0):
+        raise ValueError(f'Max lecture size in {name} must be a positive number of MiB or null, '
+                         f'got: {max_lecture_size!r}')
@@ -1,5 +1,12 @@
 import datetime as dt
 from dataclasses import dataclass, field
+from pathlib import Path
+
+# Echo360 stream prefixes of the video sources (s0 is the audio track)
+SOURCE_TYPES = {'screen': 's1', 'camera': 's2'}
+
+# Echo360 stream quality suffixes, in order of preference
+QUALITIES = {'high': ['q1', 'q0'], 'low': ['q0', 'q1']}
 
 
 @dataclass(slots=True, eq=False)
@@ -7,7 +14,7 @@ class FileInfo:
     file_name: str
     size: int
     url: str = ''
-    local_path: str = ''
+    local_path: Path | None = None
 
 
 @dataclass(init=True, slots=True, repr=False)
@@ -27,5 +34,14 @@ class Echo360Lecture:
     def lecture_identifier(self) -> str:
         return f'{self.week_number}.{self.lecture_in_week}'
 
+    @property
+    def is_audio_only(self) -> bool:
+        return all(info.file_name.startswith('s0') for info in self.file_infos)
+
+    def get_label(self, identifier_width: int = 0) -> str:
+        date_str = self.date.strftime('%B %d, %Y')
+        time_range_str = f'{self.start_time:%H:%M}-{self.end_time:%H:%M}'
+        return f'{self.lecture_identifier:<{identifier_width}}  {self.title}   {date_str} {time_range_str}'
+
     def __repr__(self) -> str:
         return f'[{self.date:%d.%m.%Y} - {self.start_time:%H:%M}-{self.end_time:%H:%M}] {self.title}'
@@ -7,7 +7,7 @@ import aiofiles
 import aiohttp
 
 from .domain import Echo360Lecture
-from .helpers import encode_path
+from .merger import get_source_folder
 
 logger = logging.getLogger(__name__)
 
@@ -30,7 +30,7 @@ async def download_lecture_files(
             if not lecture.file_infos:
                 continue
 
-            folder = output_dir / encode_path(lecture.course_name) / encode_path(repr(lecture))
+            folder = get_source_folder(output_dir, lecture)
             folder.mkdir(parents=True, exist_ok=True)
 
             for info in lecture.file_infos:
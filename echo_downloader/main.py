@@ -15,6 +15,8 @@ from .config import load_config
 from .domain import Echo360Lecture, FileInfo
 from .downloader import download_lecture_files
 from .merger import merge_files_concurrently
+from .policy import apply_size_budget, get_qualities, get_stream_policy, get_stream_prefixes
+from .selection import assign_week_numbers, get_pending_file_infos, get_selection
 from .ui import create_app, create_download_dialog, create_lectures_dialog, create_path_dialog, create_url_dialog
 
 
@@ -59,6 +61,8 @@ class EchoDownloaderApp:
 
     async def get_lecture_selection(self, course_uuid: str):
         lectures = []
+        policy = get_stream_policy(self.config, course_uuid)
+        self.logger.debug(f'Stream policy for {course_uuid}: {vars(policy)}')
 
         async with aiohttp.ClientSession() as sess:
             await sess.get(self.arbitrary_url)
@@ -97,16 +101,17 @@ class EchoDownloaderApp:
                     lecture.start_time = start_dt.time()
                     lecture.end_time = end_dt.time()
 
+                    # Streams excluded by the policy are never probed, so they are never downloaded either
                     for ext in ['mp4', 'm4s']:
-                        for source in ['s0', 's1', 's2']:
-                            for quality in ['q1', 'q0']:
+                        for source in get_stream_prefixes(policy):
+                            for quality in get_qualities(policy):
                                 file_name = f'{source}{quality}.{ext}'
                                 url = f'https://content.echo360.org.uk/0000.{institution_id}/{media_id}/1/{file_name}'
                                 async with sess.head(url) as head_response:
                                     if head_response.status == 200:
                                         file_size = int(head_response.headers['Content-Length'])
                                         lecture.file_infos.append(FileInfo(file_name, file_size, url=url))
-                                        break  # Ignore q0 (lower quality) if q1 (higher quality) exists
+                                        break  # Ignore the fallback quality if the preferred one exists
 
                     if not lecture.file_infos:
                         self.logger.warning(f'No files found for lecture: {lecture}')
@@ -121,12 +126,13 @@ class EchoDownloaderApp:
                         else:
                             lecture.file_infos = m4s_files
 
-                    date_str = lecture.date.strftime('%B %d, %Y')
-                    time_range_str = f'{lecture.start_time:%H:%M}-{lecture.end_time:%H:%M}'
+                    apply_size_budget(policy, lecture)
 
-                    lectures.append((lecture, f'{lecture.title}   {date_str} {time_range_str}'))
+                    lectures.append(lecture)
 
-        return lectures
+        assign_week_numbers(lectures)
+
+        return get_selection(lectures)
 
     async def animate_loading(self, done_event: asyncio.Event, label: Label):
         original_text = label.text
@@ -165,6 +171,19 @@ class EchoDownloaderApp:
         self.app.invalidate()
 
     def continue_to_download(self, lectures: list[Echo360Lecture], path: Path):
+        # Skip every stream that is already downloaded or muxed, not just fully downloaded lectures
+        for lecture in lectures:
+            pending_file_infos = get_pending_file_infos(self.config, path, lecture)
+            if len(pending_file_infos) < len(lecture.file_infos):
+                self.logger.info(f'Skipping {len(lecture.file_infos) - len(pending_file_infos)} already downloaded '
+                                 f'file(s) of lecture: {lecture}')
+            lecture.file_infos = pending_file_infos
+
+        lectures = [lecture for lecture in lectures if lecture.file_infos]
+        if not lectures:
+            self.app.exit(result='All selected lectures are already downloaded')
+            return
+
         files = [info for lecture in lectures for info in lecture.file_infos]
         download_dialog, set_progress = create_download_dialog(files)
         self.app.layout = Layout(download_dialog)
@@ -175,10 +194,14 @@ class EchoDownloaderApp:
             download_dialog.title = 'Muxing files...'
             self.app.invalidate()
             output_files = merge_files_concurrently(self.config, path, lectures)
+            audio_files = [info.local_path for lecture in lectures if lecture.is_audio_only
+                           for info in lecture.file_infos if info.local_path is not None]
+            results = []
             if output_files:
-                result = f'Lectures downloaded and muxed to\n{chr(10).join(map(str, output_files))}'
-            else:
-                result = 'No lectures were muxed'
+                results.append(f'Lectures downloaded and muxed to\n{chr(10).join(map(str, output_files))}')
+            if audio_files:
+                results.append(f'Lecture audio downloaded to\n{chr(10).join(map(str, audio_files))}')
+            result = '\n'.join(results) or 'No lectures were muxed'
             self.app.exit(result=result)
 
         run_in_executor_with_context(download_and_merge)
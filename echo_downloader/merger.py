@@ -4,7 +4,7 @@ from multiprocessing.pool import Pool
 from pathlib import Path
 
 from .config import EchoDownloaderConfig
-from .domain import Echo360Lecture, FileInfo
+from .domain import SOURCE_TYPES, Echo360Lecture, FileInfo
 from .helpers import encode_path
 
 logger = logging.getLogger(__name__)
@@ -59,6 +59,20 @@ def merge_files(*, audio_path: Path, video_path: Path, output_path: Path) -> Non
         logger.exception(f'Error while muxing: {e}')
 
 
+def get_source_folder(output_dir: Path, lecture: Echo360Lecture) -> Path:
+    return output_dir / encode_path(lecture.course_name) / encode_path(repr(lecture))
+
+
+def get_output_path(
+        config: EchoDownloaderConfig,
+        output_dir: Path,
+        lecture: Echo360Lecture,
+        source_type: str
+) -> Path:
+    title_suffix = config.title_suffixes[source_type]
+    return output_dir / encode_path(lecture.course_name) / (encode_path(repr(lecture)) + title_suffix + '.mp4')
+
+
 def get_file_infos(
         config: EchoDownloaderConfig,
         output_dir: Path,
@@ -67,7 +81,6 @@ def get_file_infos(
     file_infos = []
     extensions = ['m4s', 'mp4']
     qualities = ['q1', 'q0']
-    sources = {'screen': 's1', 'camera': 's2'}
 
     for lecture in lectures:
         encoded_title = encode_path(repr(lecture))
@@ -81,9 +94,8 @@ def get_file_infos(
                 if audio not in file_names:
                     continue
 
-                for source_type, source in sources.items():
-                    title_suffix = config.title_suffixes[source_type]
-                    output_path = course_folder / (encoded_title + title_suffix + '.mp4')
+                for source_type, source in SOURCE_TYPES.items():
+                    output_path = get_output_path(config, output_dir, lecture, source_type)
                     if output_path.exists():
                         logger.info(f'File already exists: {output_path}, skipping...')
                         continue
@@ -0,0 +1,29 @@
+from .config import EchoDownloaderConfig, StreamPolicy
+from .domain import QUALITIES, SOURCE_TYPES, Echo360Lecture
+
+
+def get_stream_policy(config: EchoDownloaderConfig, course_uuid: str) -> StreamPolicy:
+    # Policies are validated by load_config
+    return config.course_stream_policies.get(course_uuid, config.stream_policy)
+
+
+def get_stream_prefixes(policy: StreamPolicy) -> list[str]:
+    # Audio (s0) is always needed, followed by the videos in order of priority
+    return ['s0'] + [SOURCE_TYPES[source_type] for source_type in policy.sources]
+
+
+def get_qualities(policy: StreamPolicy) -> list[str]:
+    return QUALITIES[policy.quality]
+
+
+def apply_size_budget(policy: StreamPolicy, lecture: Echo360Lecture) -> None:
+    if policy.max_lecture_size is None:
+        return
+
+    budget = policy.max_lecture_size << 20
+
+    # Drop videos, lowest priority first, until the lecture fits the budget. Audio is always kept.
+    for source in reversed(get_stream_prefixes(policy)[1:]):
+        if sum(info.size for info in lecture.file_infos) <= budget:
+            break
+        lecture.file_infos = [info for info in lecture.file_infos if not info.file_name.startswith(source)]
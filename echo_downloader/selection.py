@@ -0,0 +1,153 @@
+import datetime as dt
+import re
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from .config import EchoDownloaderConfig
+from .domain import SOURCE_TYPES, Echo360Lecture, FileInfo
+from .merger import get_output_path, get_source_folder
+
+
+@dataclass(slots=True)
+class LectureQuery:
+    date_from: dt.date | None = None
+    date_to: dt.date | None = None
+    weeks: set[int] = field(default_factory=set)
+    title_pattern: re.Pattern[str] | None = None
+    source_types: set[str] = field(default_factory=set)
+    not_downloaded: bool = False
+
+
+def parse_query(text: str) -> LectureQuery:
+    """
+    Parse a search string into a query. Supported terms (combined with AND):
+    ``week:3``, ``week:1,4-6``, ``from:2024-09-01``, ``to:2024-12-31``,
+    ``source:screen`` and ``source:screen,camera``.
+    Everything else is treated as a case-insensitive regex matched against the title.
+
+    Raises ValueError on malformed terms.
+    """
+    query = LectureQuery()
+    title_words = []
+
+    for word in text.split():
+        key, sep, value = word.partition(':')
+        key = key.lower()
+
+        if sep and key == 'week':
+            try:
+                for part in value.split(','):
+                    first, _, last = part.partition('-')
+                    first, last = int(first), int(last or first)
+                    if last < first:
+                        raise ValueError
+                    query.weeks.update(range(first, last + 1))
+            except ValueError:
+                raise ValueError(f'Invalid week: {value}') from None
+        elif sep and key in ('from', 'to'):
+            try:
+                date = dt.date.fromisoformat(value)
+            except ValueError:
+                raise ValueError(f'Invalid date: {value}') from None
+            if key == 'from':
+                query.date_from = date
+            else:
+                query.date_to = date
+        elif sep and key == 'source':
+            source_types = set(value.lower().split(','))
+            if unknown := source_types - SOURCE_TYPES.keys():
+                raise ValueError(f'Unknown source type: {", ".join(sorted(unknown))}')
+            query.source_types.update(source_types)
+        else:
+            title_words.append(word)
+
+    if title_words:
+        try:
+            query.title_pattern = re.compile(' '.join(title_words), re.IGNORECASE)
+        except re.error as e:
+            raise ValueError(f'Invalid title pattern: {e}') from e
+
+    return query
+
+
+def assign_week_numbers(lectures: list[Echo360Lecture]) -> None:
+    # Weeks run Monday to Sunday, counting from the week of the earliest lecture
+    dated_lectures = sorted((lecture for lecture in lectures if lecture.date is not None),
+                            key=lambda lecture: (lecture.date, lecture.start_time or dt.time()))
+    if not dated_lectures:
+        return
+
+    first_date = dated_lectures[0].date
+    first_monday = first_date - dt.timedelta(days=first_date.weekday())
+    previous_week = 0
+    lecture_in_week = 0
+
+    for lecture in dated_lectures:
+        week = (lecture.date - first_monday).days // 7 + 1
+        lecture_in_week = lecture_in_week + 1 if week == previous_week else 1
+        lecture.week_number = week
+        lecture.lecture_in_week = lecture_in_week
+        previous_week = week
+
+
+def get_pending_file_infos(config: EchoDownloaderConfig, output_dir: Path, lecture: Echo360Lecture) -> list[FileInfo]:
+    # Audio only lectures are not muxed, so only audio files that are missing or incomplete are pending
+    if lecture.is_audio_only:
+        folder = get_source_folder(output_dir, lecture)
+        return [info for info in lecture.file_infos
+                if not (folder / info.file_name).exists() or (folder / info.file_name).stat().st_size != info.size]
+
+    # Videos whose muxed output already exists would only be downloaded to be skipped by the merger
+    muxed_sources = {source for source_type, source in SOURCE_TYPES.items()
+                     if get_output_path(config, output_dir, lecture, source_type).exists()}
+    file_infos = [info for info in lecture.file_infos if info.file_name[:2] not in muxed_sources]
+
+    # The audio is only needed while there is a video left to mux it with
+    if all(info.file_name.startswith('s0') for info in file_infos):
+        return []
+    return file_infos
+
+
+def get_selection(lectures: list[Echo360Lecture]) -> list[tuple[Echo360Lecture, str]]:
+    # Identifiers are padded to the longest one, so the titles line up even after week 99
+    identifier_width = max((len(lecture.lecture_identifier) for lecture in lectures), default=0)
+    return [(lecture, lecture.get_label(identifier_width)) for lecture in lectures]
+
+
+def is_downloaded(config: EchoDownloaderConfig, output_dir: Path, lecture: Echo360Lecture) -> bool:
+    return bool(lecture.file_infos) and not get_pending_file_infos(config, output_dir, lecture)
+
+
+def matches_query(
+        query: LectureQuery,
+        lecture: Echo360Lecture,
+        config: EchoDownloaderConfig | None = None,
+        output_dir: Path | None = None
+) -> bool:
+    if query.date_from is not None and (lecture.date is None or lecture.date < query.date_from):
+        return False
+    if query.date_to is not None and (lecture.date is None or lecture.date > query.date_to):
+        return False
+    if query.weeks and lecture.week_number not in query.weeks:
+        return False
+    if query.title_pattern is not None and not query.title_pattern.search(lecture.title):
+        return False
+    if query.source_types:
+        prefixes = {info.file_name[:2] for info in lecture.file_infos}
+        if not any(SOURCE_TYPES[source_type] in prefixes for source_type in query.source_types):
+            return False
+    if query.not_downloaded:
+        if config is None or output_dir is None:
+            raise ValueError('Filtering out downloaded lectures requires a known output directory')
+        if is_downloaded(config, output_dir, lecture):
+            return False
+    return True
+
+
+def select_lectures(
+        query: LectureQuery,
+        lectures: list[Echo360Lecture],
+        config: EchoDownloaderConfig | None = None,
+        output_dir: Path | None = None
+) -> list[Echo360Lecture]:
+    return [lecture for lecture in lectures if matches_query(query, lecture, config, output_dir)]
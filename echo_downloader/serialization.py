@@ -0,0 +1,90 @@
+import datetime as dt
+import json
+from pathlib import Path
+from typing import Any
+
+from .domain import Echo360Lecture, FileInfo
+
+# Bump whenever the record layout below changes
+SCHEMA_VERSION = 1
+
+# Records are positional lists rather than objects, which keeps the payload small
+# and lets (de)serialization skip per-field key lookups:
+#   FileInfo:       [file_name, size, url, local_path]
+#   Echo360Lecture: [date, start_time, end_time, course_uuid, course_name, title, url,
+#                    week_number, lecture_in_week, [file_info, ...]]
+# Dates and times are ISO 8601 strings, missing values are null.
+
+
+def file_info_to_record(info: FileInfo) -> list[Any]:
+    local_path = str(info.local_path) if info.local_path is not None else None
+    return [info.file_name, info.size, info.url, local_path]
+
+
+def file_info_from_record(record: list[Any]) -> FileInfo:
+    file_name, size, url, local_path = record
+    return FileInfo(file_name, size, url, Path(local_path) if local_path is not None else None)
+
+
+def lecture_to_record(lecture: Echo360Lecture) -> list[Any]:
+    return [
+        lecture.date.isoformat() if lecture.date is not None else None,
+        lecture.start_time.isoformat() if lecture.start_time is not None else None,
+        lecture.end_time.isoformat() if lecture.end_time is not None else None,
+        lecture.course_uuid,
+        lecture.course_name,
+        lecture.title,
+        lecture.url,
+        lecture.week_number,
+        lecture.lecture_in_week,
+        [file_info_to_record(info) for info in lecture.file_infos],
+    ]
+
+
+def lecture_from_record(record: list[Any]) -> Echo360Lecture:
+    (date, start_time, end_time, course_uuid, course_name, title, url,
+     week_number, lecture_in_week, file_infos) = record
+
+    return Echo360Lecture(
+        date=dt.date.fromisoformat(date) if date is not None else None,
+        start_time=dt.time.fromisoformat(start_time) if start_time is not None else None,
+        end_time=dt.time.fromisoformat(end_time) if end_time is not None else None,
+        course_uuid=course_uuid,
+        course_name=course_name,
+        title=title,
+        url=url,
+        week_number=week_number,
+        lecture_in_week=lecture_in_week,
+        file_infos=[file_info_from_record(info) for info in file_infos],
+    )
+
+
+def dumps_lectures(lectures: list[Echo360Lecture]) -> str:
+    payload = {
+        'version': SCHEMA_VERSION,
+        'lectures': [lecture_to_record(lecture) for lecture in lectures],
+    }
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
+
+def loads_lectures(s: str | bytes) -> list[Echo360Lecture]:
+    payload = json.loads(s)
+
+    version = payload.get('version') if isinstance(payload, dict) else None
+    if version != SCHEMA_VERSION:
+        raise ValueError(f'Unsupported lecture schema version: {version} (expected {SCHEMA_VERSION})')
+
+    try:
+        return [lecture_from_record(record) for record in payload['lectures']]
+    except (KeyError, TypeError, ValueError) as e:
+        raise ValueError(f'Malformed lecture data for schema version {SCHEMA_VERSION}: {e}') from e
+
+
+def dump_lectures(lectures: list[Echo360Lecture], path: Path) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(dumps_lectures(lectures))
+
+
+def load_lectures(path: Path) -> list[Echo360Lecture]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return loads_lectures(f.read())
@@ -7,10 +7,11 @@ import requests
 import wx
 from prompt_toolkit.application import Application, get_app
 from prompt_toolkit.completion import PathCompleter
+from prompt_toolkit.filters import Condition
 from prompt_toolkit.key_binding import KeyBindings
 from prompt_toolkit.keys import Keys
 from prompt_toolkit.layout import Dimension, Layout, VSplit
-from prompt_toolkit.layout.containers import AnyContainer, HSplit
+from prompt_toolkit.layout.containers import AnyContainer, ConditionalContainer, HSplit
 from prompt_toolkit.styles import BaseStyle
 from prompt_toolkit.validation import Validator
 from prompt_toolkit.widgets import Button, CheckboxList, Dialog, Label, ProgressBar, TextArea
@@ -18,6 +19,7 @@ from prompt_toolkit.widgets import Button, CheckboxList, Dialog, Label, Progress
 from .config import EchoDownloaderConfig
 from .domain import Echo360Lecture, FileInfo
 from .helpers import get_file_size_string, get_long_path
+from .selection import parse_query, select_lectures
 
 logger = logging.getLogger(__name__)
 
@@ -103,29 +105,82 @@ def create_lectures_dialog(
         selection: list[tuple[Echo360Lecture, str]],
         continue_callback: Callable[[list[Echo360Lecture]], None]
 ) -> tuple[Dialog, AnyContainer]:
+    app = get_app()
+    lectures = [lecture for lecture, _ in selection]
+    shown = lectures
+    # Lectures are compared by identity, dataclass equality would make every lookup compare all fields
+    shown_ids = {id(lecture) for lecture in shown}
+
+    def on_search(_):
+        nonlocal shown, shown_ids
+
+        try:
+            query = parse_query(search_input.text)
+            shown = select_lectures(query, lectures)
+        except ValueError as e:
+            shown = []
+            error_label.text = str(e)
+        else:
+            error_label.text = '' if shown else 'No matching lectures'
+
+        shown_ids = {id(lecture) for lecture in shown}
+        if shown:
+            cb_list.values = [value for value in selection if id(value[0]) in shown_ids]
+            # CheckboxList indexes values[_selected_index] on Enter, which must stay in range after the list shrinks
+            cb_list._selected_index = 0
+        app.invalidate()
+
+    def on_toggle_all() -> None:
+        checked_ids = {id(lecture) for lecture in cb_list.current_values}
+        if shown_ids <= checked_ids:
+            cb_list.current_values = [lecture for lecture in cb_list.current_values if id(lecture) not in shown_ids]
+        else:
+            cb_list.current_values += [lecture for lecture in shown if id(lecture) not in checked_ids]
+        app.invalidate()
+
     def on_submit() -> None:
-        if not cb_list.current_values:
+        # Nothing can be submitted while the search is invalid or matches no lectures
+        if not shown:
+            return
+
+        # Lectures hidden by the search are not downloaded, even if they were checked earlier
+        checked_ids = {id(lecture) for lecture in cb_list.current_values}
+        lectures_to_download = [lecture for lecture in shown if id(lecture) in checked_ids]
+        if not lectures_to_download:
             get_app().exit(result='No lectures selected')
-        lectures = cb_list.current_values
-        continue_callback(lectures)
+            return
+        continue_callback(lectures_to_download)
 
     def on_cancel() -> None:
         get_app().exit()
 
+    search_input = TextArea(multiline=False, height=1)
+    search_input.buffer.on_text_changed += on_search
+
+    search_label = Label(text='Search:', dont_extend_width=True)
+    error_label = Label(text='', style='class:red')
+    help_label = Label(text='Filters: week:1,3-5  from:YYYY-MM-DD  to:YYYY-MM-DD  source:screen,camera  <title regex>')
+
     cb_list = CheckboxList(values=selection)
 
     dialog = Dialog(
         title='Select lectures to download',
-        body=cb_list,
+        body=HSplit([
+            VSplit([search_label, search_input], padding=1),
+            help_label,
+            error_label,
+            ConditionalContainer(cb_list, filter=Condition(lambda: bool(shown))),
+        ]),
         width=Dimension(min=85),
         buttons=[
             Button(text='Continue', handler=on_submit),
+            Button(text='Toggle all', width=14, handler=on_toggle_all),
             Button(text='Cancel', handler=on_cancel),
         ],
         with_background=True,
     )
 
-    return dialog, cb_list
+    return dialog, search_input
 
 
 def create_path_dialog(
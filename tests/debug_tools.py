@@ -1,8 +1,14 @@
 import asyncio
+import datetime as dt
+import timeit
 from functools import wraps
 
 import jsonpickle
 
+from echo_downloader.domain import Echo360Lecture, FileInfo
+from echo_downloader.selection import get_selection
+from echo_downloader.serialization import dumps_lectures, loads_lectures
+
 
 class lecture_cache:
     @staticmethod
@@ -11,8 +17,8 @@ class lecture_cache:
         async def wrapper(*args, **kwargs):
             result = await func(*args, **kwargs)
 
-            with open('../test_lectures.json', 'w') as f:
-                f.write(jsonpickle.encode(result, indent=2))
+            with open('../test_lectures.json', 'w', encoding='utf-8') as f:
+                f.write(dumps_lectures([lecture for lecture, _ in result]))
 
             return result
 
@@ -22,10 +28,72 @@ class lecture_cache:
     def read(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            with open('../test_lectures.json', 'r') as f:
-                result = jsonpickle.decode(f.read())
+            with open('../test_lectures.json', 'r', encoding='utf-8') as f:
+                result = get_selection(loads_lectures(f.read()))
 
             await asyncio.sleep(1)
             return result
 
         return wrapper
+
+
+def make_lecture(file_names: tuple[str, ...] = ('s0q1.mp4', 's1q1.mp4', 's2q1.mp4'), **fields) -> Echo360Lecture:
+    # Any field can be overridden, file_infos defaults to one 1 byte file per file name
+    url = 'https://content.echo360.org.uk/0000.institution/media/1/'
+    defaults = dict(
+        date=dt.date(2024, 9, 2),
+        start_time=dt.time(10, 15),
+        end_time=dt.time(11, 45),
+        course_uuid='6432fa3a-61e1-4cfe-b7c3-94c72e1b6386',
+        course_name='Course',
+        title='Lecture',
+        file_infos=[FileInfo(file_name, 1, url=url + file_name) for file_name in file_names],
+    )
+    return Echo360Lecture(**(defaults | fields))
+
+
+def make_lectures(count: int) -> list[Echo360Lecture]:
+    lectures = []
+    start_date = dt.date(2024, 9, 2)
+
+    for i in range(count):
+        url = f'https://content.echo360.org.uk/0000.institution/media-{i}/1/'
+        lecture = make_lecture(
+            date=start_date + dt.timedelta(days=i % 365),
+            course_name='Benchmark course',
+            title=f'Lecture {i}',
+            week_number=i // 3 + 1,
+            lecture_in_week=i % 3 + 1,
+            file_infos=[
+                FileInfo(file_name, 100_000_000 + i, url=url + file_name)
+                for file_name in ['s0q1.mp4', 's1q1.mp4', 's2q1.mp4']
+            ]
+        )
+        lectures.append(lecture)
+
+    return lectures
+
+
+def benchmark_serialization(count: int = 10_000, number: int = 5) -> None:
+    lectures = make_lectures(count)
+
+    encoded = dumps_lectures(lectures)
+    pickled = jsonpickle.encode(lectures)
+    assert [repr(lecture) for lecture in loads_lectures(encoded)] == [repr(lecture) for lecture in lectures]
+
+    results = {
+        'schema dump': timeit.timeit(lambda: dumps_lectures(lectures), number=number),
+        'schema load': timeit.timeit(lambda: loads_lectures(encoded), number=number),
+        'jsonpickle dump': timeit.timeit(lambda: jsonpickle.encode(lectures), number=number),
+        'jsonpickle load': timeit.timeit(lambda: jsonpickle.decode(pickled), number=number),
+    }
+
+    print(f'{count} lectures, average of {number} runs')
+    print(f'{"schema size":<16} {len(encoded.encode()) / (1 << 20):8.2f} MiB')
+    print(f'{"jsonpickle size":<16} {len(pickled.encode()) / (1 << 20):8.2f} MiB')
+    for name, total in results.items():
+        print(f'{name:<16} {total / number * 1000:8.1f} ms')
+
+
+if __name__ == '__main__':
+    benchmark_serialization()
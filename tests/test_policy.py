@@ -0,0 +1,107 @@
+import platformdirs
+import pytest
+from objectify import dict_to_object
+
+from echo_downloader.config import StreamPolicy, load_config
+from echo_downloader.domain import FileInfo
+from echo_downloader.policy import apply_size_budget, get_qualities, get_stream_policy, get_stream_prefixes
+from tests.debug_tools import make_lecture
+
+
+def make_policy(**kwargs) -> StreamPolicy:
+    return dict_to_object({'sources': ['screen', 'camera'], 'quality': 'high', 'max_lecture_size': None} | kwargs,
+                          StreamPolicy)
+
+
+@pytest.fixture
+def config_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(platformdirs, 'user_config_path', lambda *args, **kwargs: tmp_path)
+    return tmp_path
+
+
+def test_stream_prefixes_follow_source_priority():
+    assert get_stream_prefixes(make_policy()) == ['s0', 's1', 's2']
+    assert get_stream_prefixes(make_policy(sources=['camera', 'screen'])) == ['s0', 's2', 's1']
+    assert get_stream_prefixes(make_policy(sources=[])) == ['s0']
+
+
+def test_qualities():
+    assert get_qualities(make_policy()) == ['q1', 'q0']
+    assert get_qualities(make_policy(quality='low')) == ['q0', 'q1']
+
+
+def test_size_budget_none_keeps_everything():
+    lecture = make_lecture(file_infos=[FileInfo('s0q1.m4s', 50 << 20), FileInfo('s1q1.m4s', 500 << 20),
+                                       FileInfo('s2q1.m4s', 5000 << 20)])
+
+    apply_size_budget(make_policy(), lecture)
+
+    assert [info.file_name for info in lecture.file_infos] == ['s0q1.m4s', 's1q1.m4s', 's2q1.m4s']
+
+
+@pytest.mark.parametrize('sources, budget, expected', [
+    (['screen', 'camera'], 1000, ['s0q1.m4s', 's1q1.m4s', 's2q1.m4s']),
+    (['screen', 'camera'], 600, ['s0q1.m4s', 's1q1.m4s']),
+    (['camera', 'screen'], 600, ['s0q1.m4s', 's2q1.m4s']),
+    (['screen', 'camera'], 100, ['s0q1.m4s']),
+    (['screen', 'camera'], 10, ['s0q1.m4s']),
+])
+def test_size_budget_drops_lowest_priority_first(sources, budget, expected):
+    lecture = make_lecture(file_infos=[FileInfo('s0q1.m4s', 50 << 20), FileInfo('s1q1.m4s', 300 << 20),
+                                       FileInfo('s2q1.m4s', 400 << 20)])
+
+    apply_size_budget(make_policy(sources=sources, max_lecture_size=budget), lecture)
+
+    assert [info.file_name for info in lecture.file_infos] == expected
+
+
+def test_load_config_defaults(config_dir):
+    config = load_config()
+
+    assert (config_dir / 'config.yaml').exists()
+    assert vars(config.stream_policy) == {'sources': ['screen', 'camera'], 'quality': 'high', 'max_lecture_size': None}
+    assert config.course_stream_policies == {}
+
+
+def test_load_config_merges_partial_policies(config_dir):
+    (config_dir / 'config.yaml').write_text(
+        'stream_policy:\n'
+        '  sources: [screen]\n'
+        'course_stream_policies:\n'
+        '  abc:\n'
+        '    quality: low\n'
+        '  def:\n'
+        '    sources: [camera]\n'
+        '    max_lecture_size: 300\n'
+    )
+
+    config = load_config()
+
+    assert vars(config.stream_policy) == {'sources': ['screen'], 'quality': 'high', 'max_lecture_size': None}
+    assert vars(get_stream_policy(config, 'abc')) == {'sources': ['screen'], 'quality': 'low',
+                                                       'max_lecture_size': None}
+    assert vars(get_stream_policy(config, 'def')) == {'sources': ['camera'], 'quality': 'high',
+                                                       'max_lecture_size': 300}
+    assert get_stream_policy(config, 'other') is config.stream_policy
+    assert config.max_logs == 10
+
+
+@pytest.mark.parametrize('contents, message', [
+    ('stream_policy:\n  sources: [slides]\n', 'Unknown source type in stream_policy: slides'),
+    ('stream_policy:\n  quality: best\n', 'Unknown quality in stream_policy: best'),
+    ('course_stream_policies:\n  abc:\n    quality: best\n', 'Unknown quality in course_stream_policies.abc'),
+    ('stream_policy:\n  sources: [screen, screen]\n', 'Duplicate source type in stream_policy: screen, screen'),
+    ('stream_policy:\n  sources: screen\n', "Sources in stream_policy must be a list of source types, got: 'screen'"),
+    ('stream_policy:\n  sources: [1]\n', 'Sources in stream_policy must be a list'),
+    ('stream_policy:\n  max_lecture_size: -5\n', 'Max lecture size in stream_policy must be a positive'),
+    ('stream_policy:\n  max_lecture_size: 0\n', 'Max lecture size in stream_policy must be a positive'),
+    ('stream_policy:\n  max_lecture_size: 1.5\n', 'Max lecture size in stream_policy must be a positive'),
+    ('stream_policy:\n  max_lecture_size: true\n', 'Max lecture size in stream_policy must be a positive'),
+    ('course_stream_policies:\n  abc:\n    max_lecture_size: -1\n',
+     'Max lecture size in course_stream_policies.abc'),
+])
+def test_load_config_rejects_invalid_policies(config_dir, contents, message):
+    (config_dir / 'config.yaml').write_text(contents)
+
+    with pytest.raises(ValueError, match=message):
+        load_config()
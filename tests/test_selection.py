@@ -0,0 +1,175 @@
+import datetime as dt
+
+import pytest
+
+from echo_downloader.config import EchoDownloaderConfig
+from echo_downloader.merger import get_output_path, get_source_folder
+from echo_downloader.selection import (LectureQuery, assign_week_numbers, get_pending_file_infos, get_selection,
+                                       is_downloaded, matches_query, parse_query, select_lectures)
+from tests.debug_tools import make_lecture
+
+
+@pytest.fixture
+def config() -> EchoDownloaderConfig:
+    config = EchoDownloaderConfig()
+    config.title_suffixes = {'screen': ' %7C Screen', 'camera': ' %7C Camera'}
+    return config
+
+
+@pytest.mark.parametrize('text, weeks', [
+    ('week:3', {3}),
+    ('week:1,4-6', {1, 4, 5, 6}),
+    ('week:2-2', {2}),
+    ('week:1 week:3', {1, 3}),
+])
+def test_parse_weeks(text, weeks):
+    assert parse_query(text).weeks == weeks
+
+
+@pytest.mark.parametrize('text', ['week:5-3', 'week:x', 'week:', 'week:1,'])
+def test_parse_invalid_weeks(text):
+    with pytest.raises(ValueError, match='Invalid week'):
+        parse_query(text)
+
+
+def test_parse_dates():
+    query = parse_query('from:2024-09-01 to:2024-12-31')
+    assert query.date_from == dt.date(2024, 9, 1)
+    assert query.date_to == dt.date(2024, 12, 31)
+
+
+@pytest.mark.parametrize('text', ['from:2024', 'to:2024-13-01', 'from:'])
+def test_parse_invalid_dates(text):
+    with pytest.raises(ValueError, match='Invalid date'):
+        parse_query(text)
+
+
+def test_parse_sources():
+    assert parse_query('source:Screen,camera').source_types == {'screen', 'camera'}
+
+    with pytest.raises(ValueError, match='Unknown source type'):
+        parse_query('source:screen|camera')
+
+
+def test_parse_title_pattern():
+    query = parse_query('new   era')
+    assert query.title_pattern.pattern == 'new era'
+    assert not query.not_downloaded
+    assert matches_query(query, make_lecture(date=dt.date(2024, 9, 2), title='A NEW ERA'))
+
+    with pytest.raises(ValueError, match='Invalid title pattern'):
+        parse_query('(unclosed')
+
+
+def test_week_numbers_start_on_monday():
+    # 2024-09-04 is a Wednesday, so its week runs from Monday 09-02 to Sunday 09-08
+    lectures = [make_lecture(date=dt.date(2024, 9, day)) for day in (4, 8, 9, 15, 16, 30)]
+
+    assign_week_numbers(lectures)
+
+    assert [lecture.week_number for lecture in lectures] == [1, 1, 2, 2, 3, 5]
+
+
+def test_lecture_in_week_follows_chronological_order():
+    thursday = make_lecture(date=dt.date(2024, 9, 5))
+    monday_late = make_lecture(date=dt.date(2024, 9, 2), start_time=dt.time(14))
+    monday_early = make_lecture(date=dt.date(2024, 9, 2), start_time=dt.time(8))
+    next_week = make_lecture(date=dt.date(2024, 9, 9))
+    undated = make_lecture(date=None)
+
+    assign_week_numbers([thursday, next_week, undated, monday_late, monday_early])
+
+    assert monday_early.lecture_identifier == '1.1'
+    assert monday_late.lecture_identifier == '1.2'
+    assert thursday.lecture_identifier == '1.3'
+    assert next_week.lecture_identifier == '2.1'
+    assert undated.lecture_identifier == '0.0'
+
+
+def test_selection_labels_line_up():
+    lectures = [make_lecture(week_number=1, lecture_in_week=1, title='First'),
+                make_lecture(week_number=100, lecture_in_week=10, title='Last')]
+
+    labels = [label for _, label in get_selection(lectures)]
+
+    assert labels == ['1.1     First   September 02, 2024 10:15-11:45',
+                      '100.10  Last   September 02, 2024 10:15-11:45']
+
+
+def test_matches_date_range_and_weeks():
+    lectures = [make_lecture(date=dt.date(2024, 9, day)) for day in (2, 9, 16, 23)]
+    assign_week_numbers(lectures)
+
+    assert select_lectures(parse_query('from:2024-09-09 to:2024-09-16'), lectures) == lectures[1:3]
+    assert select_lectures(parse_query('week:1,4'), lectures) == [lectures[0], lectures[3]]
+    assert not matches_query(parse_query('from:2024-09-01'), make_lecture(date=None))
+
+
+def test_matches_source_types():
+    screen_only = make_lecture(date=dt.date(2024, 9, 2), file_names=('s0q1.m4s', 's1q1.m4s'))
+
+    assert matches_query(parse_query('source:screen'), screen_only)
+    assert not matches_query(parse_query('source:camera'), screen_only)
+    assert matches_query(parse_query('source:screen,camera'), screen_only)
+
+
+def test_is_downloaded(tmp_path, config):
+    lecture = make_lecture(date=dt.date(2024, 9, 2))
+    screen_path = get_output_path(config, tmp_path, lecture, 'screen')
+    camera_path = get_output_path(config, tmp_path, lecture, 'camera')
+    screen_path.parent.mkdir(parents=True)
+
+    assert not is_downloaded(config, tmp_path, lecture)
+
+    screen_path.touch()
+    assert not is_downloaded(config, tmp_path, lecture)
+
+    camera_path.touch()
+    assert is_downloaded(config, tmp_path, lecture)
+
+
+def test_audio_only_lecture_is_downloaded_when_audio_exists(tmp_path, config):
+    lecture = make_lecture(file_names=('s0q1.m4s',))
+    folder = get_source_folder(tmp_path, lecture)
+    folder.mkdir(parents=True)
+
+    assert lecture.is_audio_only
+    assert not is_downloaded(config, tmp_path, lecture)
+
+    (folder / 's0q1.m4s').write_bytes(b'\0' * 100)
+    assert not is_downloaded(config, tmp_path, lecture)
+
+    (folder / 's0q1.m4s').write_bytes(b'\0')
+    assert is_downloaded(config, tmp_path, lecture)
+
+
+def test_pending_file_infos_skip_muxed_streams(tmp_path, config):
+    lecture = make_lecture(date=dt.date(2024, 9, 2))
+    screen_path = get_output_path(config, tmp_path, lecture, 'screen')
+    screen_path.parent.mkdir(parents=True)
+
+    def pending_file_names() -> list[str]:
+        return [info.file_name for info in get_pending_file_infos(config, tmp_path, lecture)]
+
+    assert pending_file_names() == ['s0q1.mp4', 's1q1.mp4', 's2q1.mp4']
+
+    screen_path.touch()
+    assert pending_file_names() == ['s0q1.mp4', 's2q1.mp4']
+
+    # Audio is not downloaded once there is nothing left to mux it with
+    get_output_path(config, tmp_path, lecture, 'camera').touch()
+    assert pending_file_names() == []
+
+
+def test_not_downloaded_query(tmp_path, config):
+    lectures = [make_lecture(date=dt.date(2024, 9, 2), file_names=('s0q1.m4s', 's1q1.m4s')),
+                make_lecture(date=dt.date(2024, 9, 3), file_names=('s0q1.m4s', 's1q1.m4s'))]
+    output_path = get_output_path(config, tmp_path, lectures[0], 'screen')
+    output_path.parent.mkdir(parents=True)
+    output_path.touch()
+
+    query = LectureQuery(not_downloaded=True)
+
+    assert select_lectures(query, lectures, config, tmp_path) == [lectures[1]]
+    with pytest.raises(ValueError, match='output directory'):
+        select_lectures(query, lectures)
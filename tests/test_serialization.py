@@ -0,0 +1,70 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from echo_downloader.domain import FileInfo
+from echo_downloader.serialization import (SCHEMA_VERSION, dump_lectures, dumps_lectures, lecture_to_record,
+                                           load_lectures, loads_lectures)
+from tests.debug_tools import make_lecture
+
+
+def test_round_trip_preserves_all_fields():
+    lectures = [
+        make_lecture(
+            course_name='Programmeerimine',
+            title='Loeng 1 – sissejuhatus',
+            url='https://echo360.org.uk/lesson/1',
+            week_number=1,
+            lecture_in_week=2,
+            file_infos=[
+                FileInfo('s0q1.m4s', 1234, url='https://content.echo360.org.uk/s0q1.m4s',
+                         local_path=Path('a/s0q1.m4s')),
+                FileInfo('s1q1.m4s', 5678, url='https://content.echo360.org.uk/s1q1.m4s'),
+            ],
+        ),
+        make_lecture(date=None, start_time=None, end_time=None, file_infos=[]),
+    ]
+
+    loaded = loads_lectures(dumps_lectures(lectures))
+
+    assert [lecture_to_record(lecture) for lecture in loaded] == [lecture_to_record(lecture) for lecture in lectures]
+    assert loaded[0].file_infos[0].local_path == Path('a/s0q1.m4s')
+    assert loaded[0].file_infos[1].local_path is None
+    assert loaded[1].date is None and loaded[1].start_time is None and loaded[1].end_time is None
+
+
+def test_dump_and_load_file(tmp_path):
+    path = tmp_path / 'lectures.json'
+    dump_lectures([make_lecture()], path)
+
+    assert [lecture_to_record(lecture) for lecture in load_lectures(path)] == [lecture_to_record(make_lecture())]
+
+
+def test_payload_is_versioned():
+    assert json.loads(dumps_lectures([]))['version'] == SCHEMA_VERSION
+
+
+@pytest.mark.parametrize('payload', [
+    '[]',
+    '{"version": 0, "lectures": []}',
+    '{"lectures": []}',
+])
+def test_unsupported_version(payload):
+    with pytest.raises(ValueError, match='Unsupported lecture schema version'):
+        loads_lectures(payload)
+
+
+@pytest.mark.parametrize('lectures', [
+    '[["2024-09-02"]]',
+    '[[null, null, null, "", "", "", "", 0, 0, [["s0q1.m4s", 1]]]]',
+    '[["not a date", null, null, "", "", "", "", 0, 0, []]]',
+])
+def test_malformed_records(lectures):
+    with pytest.raises(ValueError, match=f'schema version {SCHEMA_VERSION}'):
+        loads_lectures(f'{{"version": {SCHEMA_VERSION}, "lectures": {lectures}}}')
+
+
+def test_missing_lectures():
+    with pytest.raises(ValueError, match='Malformed'):
+        loads_lectures(f'{{"version": {SCHEMA_VERSION}}}')